@@ -0,0 +1,80 @@
+from numba import njit, prange
+
+# Number of rows housing_batch_kernel writes into its output array
+N_OUTPUTS = 17
+
+# No cache=True: main imports this module as either investment.kernels or kernels, and
+# Numba's on-disk cache records the importing name, so a cache written under one name
+# breaks loading under the other. Compiling once per process is the price.
+
+@njit
+def mortgage_math(principal, monthly_rate, num_payments, months_paid):
+    """Compiled counterpart of main._mortgage_math: (monthly payment, remaining principal)"""
+    if monthly_rate == 0:
+        monthly_payment = principal / num_payments
+        remaining = principal - monthly_payment * months_paid
+    else:
+        growth_term = (1 + monthly_rate)**num_payments
+        monthly_payment = principal * (monthly_rate * growth_term) / (growth_term - 1)
+        growth_paid = (1 + monthly_rate)**months_paid
+        remaining = principal * growth_paid - monthly_payment * (growth_paid - 1) / monthly_rate
+
+    if months_paid >= num_payments:
+        remaining = 0.0
+    return monthly_payment, remaining
+
+@njit(parallel=True, fastmath=True)
+def housing_batch_kernel(purchase_price, down_payment_percent, loan_interest_rate,
+                         loan_term_years, holding_period_years, property_tax_annual,
+                         hoa_monthly, sale_price, monthly_rent,
+                         stock_investment_return, selling_cost_percent, out):
+    """
+    Fused per-scenario housing math for analyze_housing_investment_batch
+
+    Every input is a 1-D float array of the same length. One pass computes all
+    derived values of scenario i and writes them to out[:, i], in this order:
+    down_payment, loan_amount, monthly_payment, total_mortgage_payments,
+    total_property_tax, total_hoa, remaining_balance, selling_costs, rent_cost,
+    costs_buying, net_from_sale, equity_gain, total_benefit, rent_only_net,
+    investment_value, investment_gain, rent_invest_net
+    """
+    for i in prange(purchase_price.shape[0]):
+        down_payment = purchase_price[i] * down_payment_percent[i]
+        loan_amount = purchase_price[i] - down_payment
+
+        monthly_rate = loan_interest_rate[i] / 12
+        num_payments = loan_term_years[i] * 12
+        total_months = holding_period_years[i] * 12
+
+        monthly_payment, remaining_balance = mortgage_math(loan_amount, monthly_rate, num_payments, total_months)
+
+        total_mortgage_payments = monthly_payment * total_months
+        total_property_tax = property_tax_annual[i] * holding_period_years[i]
+        total_hoa = hoa_monthly[i] * total_months
+        selling_costs = sale_price[i] * selling_cost_percent[i]
+        rent_cost = monthly_rent[i] * total_months
+
+        costs_buying = down_payment + total_mortgage_payments + total_property_tax + total_hoa
+        net_from_sale = sale_price[i] - selling_costs - remaining_balance
+        equity_gain = net_from_sale - costs_buying
+
+        investment_value = down_payment * (1 + stock_investment_return[i])**holding_period_years[i]
+        investment_gain = investment_value - down_payment
+
+        out[0, i] = down_payment
+        out[1, i] = loan_amount
+        out[2, i] = monthly_payment
+        out[3, i] = total_mortgage_payments
+        out[4, i] = total_property_tax
+        out[5, i] = total_hoa
+        out[6, i] = remaining_balance
+        out[7, i] = selling_costs
+        out[8, i] = rent_cost
+        out[9, i] = costs_buying
+        out[10, i] = net_from_sale
+        out[11, i] = equity_gain
+        out[12, i] = equity_gain + rent_cost
+        out[13, i] = -rent_cost
+        out[14, i] = investment_value
+        out[15, i] = investment_gain
+        out[16, i] = investment_gain - rent_cost
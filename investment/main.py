@@ -1,31 +1,109 @@
-import numpy as np
-import matplotlib.pyplot as plt
+import argparse
+import math
+import sys
+from dataclasses import dataclass
+from functools import lru_cache
+
+# ANSI escape codes used by format_color
+RED = '\033[91m'
+GREEN = '\033[92m'
+YELLOW = '\033[93m'
+BLUE = '\033[94m'
+PURPLE = '\033[95m'
+CYAN = '\033[96m'
+WHITE = '\033[97m'
+BOLD = '\033[1m'
+UNDERLINE = '\033[4m'
+END = '\033[0m'
+
+_COLORS = {
+    'red': RED,
+    'green': GREEN,
+    'yellow': YELLOW,
+    'blue': BLUE,
+    'purple': PURPLE,
+    'cyan': CYAN,
+    'white': WHITE,
+    'bold': BOLD,
+    'underline': UNDERLINE,
+    'end': END
+}
+
+@dataclass(slots=True)
+class HousingInputs:
+    """Inputs of a housing analysis plus the derived loan figures"""
+    purchase_price: float
+    down_payment: float
+    loan_amount: float
+    monthly_payment: float
+    holding_period_years: float
+    sale_price: float
+    monthly_rent: float
+    stock_investment_return: float
+    selling_cost_percent: float
+    loan_interest_rate: float
+    loan_term_years: float
+
+@dataclass(slots=True)
+class BuyAndSell:
+    """Scenario 1: buy, hold, then sell"""
+    total_payments: float
+    mortgage_payments: float
+    property_tax: float
+    hoa_fees: float
+    remaining_balance: float
+    selling_costs: float
+    net_from_sale: float
+    equity_gain: float
+    rent_savings: float
+    total_benefit: float
+
+@dataclass(slots=True)
+class RentOnly:
+    """Scenario 2: rent and don't invest"""
+    total_rent: float
+    net_worth_change: float
+
+@dataclass(slots=True)
+class RentAndInvest:
+    """Scenario 3: rent and invest the down payment"""
+    total_rent: float
+    investment_value: float
+    investment_gain: float
+    net_worth_change: float
+
+@dataclass(slots=True)
+class HousingResults:
+    """Result of analyze_housing_investment (arrays instead of floats from the batch variant)"""
+    inputs: HousingInputs
+    buy_and_sell: BuyAndSell
+    rent_only: RentOnly
+    rent_and_invest: RentAndInvest
 
 def calculate_mortgage_payment(principal, annual_rate, years):
     """Calculate monthly mortgage payment"""
-    monthly_rate = annual_rate / 12
-    num_payments = years * 12
+    return _mortgage_math(principal, annual_rate / 12, years * 12, 0)[0]
+
+@lru_cache(maxsize=1024)
+def _mortgage_math(principal, monthly_rate, num_payments, months_paid):
+    """Return (monthly payment, remaining principal), evaluating each power only once"""
     if monthly_rate == 0:
-        return principal / num_payments
-    return principal * (monthly_rate * (1 + monthly_rate)**num_payments) / ((1 + monthly_rate)**num_payments - 1)
+        monthly_payment = principal / num_payments
+        remaining = principal - (monthly_payment * months_paid)
+    else:
+        growth_term = (1 + monthly_rate)**num_payments
+        monthly_payment = principal * (monthly_rate * growth_term) / (growth_term - 1)
+        # Closed-form balance: grown principal minus the future value of the payments made
+        growth_paid = (1 + monthly_rate)**months_paid
+        remaining = principal * growth_paid - monthly_payment * (growth_paid - 1) / monthly_rate
+
+    if months_paid >= num_payments:
+        remaining = 0
+    return monthly_payment, remaining
 
 def calculate_remaining_principal(principal, annual_rate, years, months_paid):
     """Calculate remaining principal after a certain number of months"""
-    if months_paid >= years * 12:
-        return 0
-    
-    monthly_rate = annual_rate / 12
-    num_payments = years * 12
-    monthly_payment = calculate_mortgage_payment(principal, annual_rate, years)
-    
-    if monthly_rate == 0:
-        return principal - (monthly_payment * months_paid)
-    
-    remaining = principal * (1 + monthly_rate)**months_paid
-    for i in range(months_paid):
-        remaining -= monthly_payment * (1 + monthly_rate)**(months_paid - 1 - i)
-    
-    return remaining
+    return _mortgage_math(principal, annual_rate / 12, years * 12, months_paid)[1]
 
 def analyze_housing_investment(purchase_price, down_payment_percent, loan_interest_rate, 
                               loan_term_years, holding_period_years, property_tax_annual,
@@ -33,6 +111,9 @@ def analyze_housing_investment(purchase_price, down_payment_percent, loan_intere
                               stock_investment_return, selling_cost_percent):
     """
     Analyze and compare different housing investment scenarios
+
+    Compute-bound but O(1): a few dozen float operations with the mortgage math
+    in closed form. For many scenarios use analyze_housing_investment_batch.
     
     Args:
         purchase_price: House purchase price
@@ -48,103 +129,168 @@ def analyze_housing_investment(purchase_price, down_payment_percent, loan_intere
         selling_cost_percent: Selling costs as a percentage of sale price
         
     Returns:
-        Dictionary containing analysis of different scenarios
+        HousingResults containing analysis of different scenarios
     """
     # Calculate down payment and loan amount
     down_payment = purchase_price * down_payment_percent
     loan_amount = purchase_price - down_payment
     
-    # Calculate monthly mortgage payment
-    monthly_payment = calculate_mortgage_payment(loan_amount, loan_interest_rate, loan_term_years)
+    # Calculate monthly mortgage payment and remaining loan balance after holding period
+    total_months = holding_period_years * 12
+    monthly_payment, remaining_balance = _mortgage_math(
+        loan_amount, loan_interest_rate / 12, loan_term_years * 12, total_months)
     
     # Calculate total payments over holding period
-    total_months = holding_period_years * 12
     total_mortgage_payments = monthly_payment * total_months
     total_property_tax = property_tax_annual * holding_period_years
     total_hoa = hoa_monthly * total_months
     
-    # Calculate remaining loan balance after holding period
-    remaining_balance = calculate_remaining_principal(loan_amount, loan_interest_rate, loan_term_years, total_months)
-    
     # Calculate selling costs
     selling_costs = sale_price * selling_cost_percent
     
+    # Scenario 2: Rent and don't invest (the same rent is saved in scenario 1)
+    rent_cost = monthly_rent * total_months
+
     # Scenario 1: Buy and sell
     costs_buying = down_payment + total_mortgage_payments + total_property_tax + total_hoa
     net_from_sale = sale_price - selling_costs - remaining_balance
-    buy_profit = net_from_sale - costs_buying
-    
-    # Modify this line
-    buy_equity_gain = net_from_sale - (down_payment + total_mortgage_payments + total_property_tax + total_hoa)
-    
+    buy_equity_gain = net_from_sale - costs_buying
+
     # Calculate rent savings
-    rent_savings = monthly_rent * total_months
+    rent_savings = rent_cost
     buy_total_benefit = buy_equity_gain + rent_savings
-    
-    # Scenario 2: Rent and don't invest
-    rent_cost = monthly_rent * total_months
-    
+
     # Scenario 3: Rent and invest down payment
     # Calculate future value of investment
     investment_future_value = down_payment * (1 + stock_investment_return)**(holding_period_years)
     investment_gain = investment_future_value - down_payment
     rent_invest_net = investment_gain - rent_cost
     
-    results = {
-        "inputs": {
-            "purchase_price": purchase_price,
-            "down_payment": down_payment,
-            "loan_amount": loan_amount,
-            "monthly_payment": monthly_payment,
-            "holding_period_years": holding_period_years,
-            "sale_price": sale_price,
-            "monthly_rent": monthly_rent,
-            "stock_investment_return": stock_investment_return,
-            "selling_cost_percent": selling_cost_percent,
-            "loan_interest_rate": loan_interest_rate,
-            "loan_term_years": loan_term_years
-        },
-        "buy_and_sell": {
-            "total_payments": costs_buying,
-            "mortgage_payments": total_mortgage_payments,
-            "property_tax": total_property_tax,
-            "hoa_fees": total_hoa,
-            "remaining_balance": remaining_balance,
-            "selling_costs": selling_costs,
-            "net_from_sale": net_from_sale,
-            "equity_gain": buy_equity_gain,
-            "rent_savings": rent_savings,
-            "total_benefit": buy_total_benefit
-        },
-        "rent_only": {
-            "total_rent": rent_cost,
-            "net_worth_change": -rent_cost
-        },
-        "rent_and_invest": {
-            "total_rent": rent_cost,
-            "investment_value": investment_future_value,
-            "investment_gain": investment_gain,
-            "net_worth_change": rent_invest_net
-        }
-    }
-    
-    return results
+    return HousingResults(
+        inputs=HousingInputs(
+            purchase_price=purchase_price,
+            down_payment=down_payment,
+            loan_amount=loan_amount,
+            monthly_payment=monthly_payment,
+            holding_period_years=holding_period_years,
+            sale_price=sale_price,
+            monthly_rent=monthly_rent,
+            stock_investment_return=stock_investment_return,
+            selling_cost_percent=selling_cost_percent,
+            loan_interest_rate=loan_interest_rate,
+            loan_term_years=loan_term_years
+        ),
+        buy_and_sell=BuyAndSell(
+            total_payments=costs_buying,
+            mortgage_payments=total_mortgage_payments,
+            property_tax=total_property_tax,
+            hoa_fees=total_hoa,
+            remaining_balance=remaining_balance,
+            selling_costs=selling_costs,
+            net_from_sale=net_from_sale,
+            equity_gain=buy_equity_gain,
+            rent_savings=rent_savings,
+            total_benefit=buy_total_benefit
+        ),
+        rent_only=RentOnly(
+            total_rent=rent_cost,
+            net_worth_change=-rent_cost
+        ),
+        rent_and_invest=RentAndInvest(
+            total_rent=rent_cost,
+            investment_value=investment_future_value,
+            investment_gain=investment_gain,
+            net_worth_change=rent_invest_net
+        )
+    )
+
+def analyze_housing_investment_batch(purchase_price, down_payment_percent, loan_interest_rate,
+                                     loan_term_years, holding_period_years, property_tax_annual,
+                                     hoa_monthly, sale_price, monthly_rent,
+                                     stock_investment_return, selling_cost_percent):
+    """
+    Vectorized analyze_housing_investment for parameter sweeps
+
+    Takes the same arguments as analyze_housing_investment, but each one may be
+    a scalar or an array. Arguments are broadcast against each other with the
+    usual NumPy rules, so a grid sweep is a single call, e.g.
+    loan_interest_rate=rates[:, None], sale_price=prices[None, :]. The math
+    runs in a parallel Numba kernel (see kernels.py).
+
+    Returns:
+        HousingResults like analyze_housing_investment, with arrays of the
+        broadcast shape in place of scalars (0-d arrays if every argument is a scalar)
+    """
+    import numpy as np
+    # Relative when imported as investment.main, plain when main.py runs as a script
+    if __package__:
+        from .kernels import N_OUTPUTS, housing_batch_kernel
+    else:
+        from kernels import N_OUTPUTS, housing_batch_kernel
+
+    # C-ordered copies rather than broadcast views: the views are read-only and zero-stride,
+    # so they must not end up in the returned HousingInputs, and ravel() below stays a view
+    args = [np.array(arg, order="C") for arg in np.broadcast_arrays(*(
+        np.asarray(arg, dtype=float) for arg in (
+            purchase_price, down_payment_percent, loan_interest_rate, loan_term_years,
+            holding_period_years, property_tax_annual, hoa_monthly, sale_price, monthly_rent,
+            stock_investment_return, selling_cost_percent)))]
+    shape = args[0].shape
+
+    # One fused pass over all scenarios instead of a chain of full-size temporaries;
+    # the kernel works on flat arrays, the outputs are reshaped back afterwards
+    out = np.empty((N_OUTPUTS, args[0].size))
+    housing_batch_kernel(*(arg.ravel() for arg in args), out)
+
+    (purchase_price, down_payment_percent, loan_interest_rate, loan_term_years,
+     holding_period_years, property_tax_annual, hoa_monthly, sale_price, monthly_rent,
+     stock_investment_return, selling_cost_percent) = args
+    (down_payment, loan_amount, monthly_payment, total_mortgage_payments, total_property_tax,
+     total_hoa, remaining_balance, selling_costs, rent_cost, costs_buying, net_from_sale,
+     buy_equity_gain, buy_total_benefit, rent_only_net, investment_future_value,
+     investment_gain, rent_invest_net) = (row[...] for row in out.reshape((N_OUTPUTS, *shape)))  # [...] keeps 0-d rows arrays
+
+    return HousingResults(
+        inputs=HousingInputs(
+            purchase_price=purchase_price,
+            down_payment=down_payment,
+            loan_amount=loan_amount,
+            monthly_payment=monthly_payment,
+            holding_period_years=holding_period_years,
+            sale_price=sale_price,
+            monthly_rent=monthly_rent,
+            stock_investment_return=stock_investment_return,
+            selling_cost_percent=selling_cost_percent,
+            loan_interest_rate=loan_interest_rate,
+            loan_term_years=loan_term_years
+        ),
+        buy_and_sell=BuyAndSell(
+            total_payments=costs_buying,
+            mortgage_payments=total_mortgage_payments,
+            property_tax=total_property_tax,
+            hoa_fees=total_hoa,
+            remaining_balance=remaining_balance,
+            selling_costs=selling_costs,
+            net_from_sale=net_from_sale,
+            equity_gain=buy_equity_gain,
+            rent_savings=rent_cost,
+            total_benefit=buy_total_benefit
+        ),
+        rent_only=RentOnly(
+            total_rent=rent_cost,
+            net_worth_change=rent_only_net
+        ),
+        rent_and_invest=RentAndInvest(
+            total_rent=rent_cost,
+            investment_value=investment_future_value,
+            investment_gain=investment_gain,
+            net_worth_change=rent_invest_net
+        )
+    )
 
 def format_color(text, color):
     """Format text with color using ANSI escape codes"""
-    colors = {
-        'red': '\033[91m',
-        'green': '\033[92m',
-        'yellow': '\033[93m',
-        'blue': '\033[94m',
-        'purple': '\033[95m',
-        'cyan': '\033[96m',
-        'white': '\033[97m',
-        'bold': '\033[1m',
-        'underline': '\033[4m',
-        'end': '\033[0m'
-    }
-    return f"{colors.get(color, '')}{text}{colors['end']}"
+    return f"{_COLORS.get(color, '')}{text}{END}"
 
 def format_currency(amount, color=None):
     """Format amount as currency with optional color"""
@@ -155,125 +301,133 @@ def format_currency(amount, color=None):
 
 def print_results(results):
     """Print analysis results in a readable format with calculation details"""
-    inputs = results["inputs"]
-    buy = results["buy_and_sell"]
-    rent = results["rent_only"]
-    invest = results["rent_and_invest"]
-    
-    print(f"\n{format_color('===== HOUSING INVESTMENT ANALYSIS =====', 'bold')}\n")
-    
-    print(f"{format_color('INPUTS:', 'cyan')}")
-    print(f"Purchase Price: {format_currency(inputs['purchase_price'], 'yellow')}")
-    print(f"Down Payment: {format_currency(inputs['down_payment'], 'yellow')} ({inputs['down_payment']/inputs['purchase_price']*100:.1f}%)")
-    print(f"Loan Amount: {format_currency(inputs['loan_amount'], 'yellow')} (Purchase Price - Down Payment)")
-    
-    print(f"\n{format_color('MORTGAGE PAYMENT CALCULATION:', 'cyan')}")
-    print(f"  Loan Amount: {format_currency(inputs['loan_amount'], 'yellow')}")
-    print(f"  Annual Interest Rate: {format_color(f'{inputs['loan_interest_rate']*100:.2f}%', 'purple')}")
-    print(f"  Monthly Interest Rate: {format_color(f'{inputs['loan_interest_rate']/12*100:.4f}%', 'purple')}")
-    print(f"  Loan Term: {format_color(f'{inputs['loan_term_years']} years ({inputs['loan_term_years']*12} months)', 'white')}")
-    print(f"Monthly Mortgage Payment: {format_currency(inputs['monthly_payment'], 'green')}")
-    
-    print(f"\n{format_color('SCENARIO 1: BUY AND SELL AFTER HOLDING PERIOD', 'cyan')}")
-    print("Monthly Mortgage Payment Breakdown:")
-    print(f"  Monthly Payment: {format_currency(inputs['monthly_payment'], 'green')}")
-    print(f"  Number of Months: {format_color(str(inputs['holding_period_years']*12), 'white')} months")
-    print(f"Total Mortgage Payments: {format_currency(buy['mortgage_payments'], 'red')}")
-    
-    print("\nProperty Tax Breakdown:")
-    print(f"  Annual Property Tax: {format_currency(buy['property_tax']/inputs['holding_period_years'], 'yellow')}")
-    print(f"Total Property Tax: {format_currency(buy['property_tax'], 'red')}")
-    
-    print("\nHOA Breakdown:")
-    print(f"  Monthly HOA: {format_currency(buy['hoa_fees']/(inputs['holding_period_years']*12), 'yellow')}")
-    print(f"Total HOA Fees: {format_currency(buy['hoa_fees'], 'red')}")
-    
-    print(f"\n{format_color('Remaining Loan Balance:', 'cyan')} {format_currency(buy['remaining_balance'], 'red')}")
-    
-    print(f"\n{format_color('Net from Sale Calculation:', 'cyan')}")
-    print(f"  Sale Price: {format_currency(inputs['sale_price'], 'green')}")
-    print(f"  - Selling Costs: {format_currency(buy['selling_costs'], 'red')}")
-    print(f"  - Remaining Balance: {format_currency(buy['remaining_balance'], 'red')}")
-    print(f"  = Net from Sale: {format_currency(buy['net_from_sale'], 'green')}")
-    
-    print(f"\n{format_color('Equity Gain Calculation:', 'cyan')}")
-    print(f"  Net from Sale: {format_currency(buy['net_from_sale'], 'green')}")
-    print("  Money invested:")
-    print(f"    - Down Payment: {format_currency(inputs['down_payment'], 'red')}")
-    print(f"    - Total Mortgage Payments: {format_currency(buy['mortgage_payments'], 'red')}")
-    print(f"    - Total Property Tax: {format_currency(buy['property_tax'], 'red')}")
-    print(f"    - Total HOA: {format_currency(buy['hoa_fees'], 'red')}")
-    total_invested = inputs['down_payment'] + buy['mortgage_payments'] + buy['property_tax'] + buy['hoa_fees']
-    print(f"  Total Money Invested: {format_currency(total_invested, 'red')}")
-    print(f"  Equity Gain: {format_currency(buy['equity_gain'], 'green' if buy['equity_gain'] > 0 else 'red')}")
-    
-    print(f"\n{format_color('Total Benefit Calculation:', 'cyan')}")
-    print(f"  Equity Gain: {format_currency(buy['equity_gain'], 'green' if buy['equity_gain'] > 0 else 'red')}")
-    print(f"  + Rent Savings: {format_currency(buy['rent_savings'], 'green')}")
-    print(f"  = Total Benefit: {format_currency(buy['total_benefit'], 'green' if buy['total_benefit'] > 0 else 'red')}")
-    
-    print(f"\n{format_color('SCENARIO 2: RENT ONLY', 'cyan')}")
-    print("Total Rent Paid Calculation:")
-    print(f"  Monthly Rent: {format_currency(inputs['monthly_rent'], 'yellow')}")
-    print(f"  × Number of Months: {format_color(str(inputs['holding_period_years']*12), 'white')} months")
-    print(f"  = Total Rent Paid: {format_currency(rent['total_rent'], 'red')} ({format_currency(inputs['monthly_rent'], 'yellow')} × {inputs['holding_period_years']*12} months)")
-    print(f"  Net Worth Change: {format_currency(rent['net_worth_change'], 'red')} (negative of total rent paid)")
-    
-    print(f"\n{format_color('SCENARIO 3: RENT AND INVEST DOWN PAYMENT', 'cyan')}")
-    print("Rent Cost:")
-    print(f"  Monthly Rent: {format_currency(inputs['monthly_rent'], 'yellow')}")
-    print(f"  × Number of Months: {format_color(str(inputs['holding_period_years']*12), 'white')} months")
-    print(f"  = Total Rent Paid: {format_currency(invest['total_rent'], 'red')} ({format_currency(inputs['monthly_rent'], 'yellow')} × {inputs['holding_period_years']*12} months)")
-    
-    print("\nInvestment Calculation:")
-    print(f"  Initial Investment (Down Payment): {format_currency(inputs['down_payment'], 'yellow')}")
-    print(f"  Annual Return Rate: {format_color(f'{inputs['stock_investment_return']*100:.1f}%', 'purple')}")
-    print(f"  Investment Period: {format_color(str(inputs['holding_period_years']), 'white')} years")
-    print(f"  Formula: Initial × (1 + Return Rate)^Years")
-    print(f"  = {format_currency(inputs['down_payment'], 'yellow')} × (1 + {inputs['stock_investment_return']*100:.1f}%)^{inputs['holding_period_years']}")
-    print(f"Investment Future Value: {format_currency(invest['investment_value'], 'green')}")
-    print(f"Investment Gain: {format_currency(invest['investment_gain'], 'green')} (Future Value - Initial Investment)")
-    print(f"Net Worth Change: {format_currency(invest['net_worth_change'], 'green' if invest['net_worth_change'] > 0 else 'red')} (Investment Gain - Total Rent)")
-    
-    print(f"\n{format_color('COMPARISON:', 'bold')}")
-    buy_vs_rent = buy['total_benefit'] - rent['net_worth_change']
-    buy_vs_invest = buy['total_benefit'] - invest['net_worth_change']
-    invest_vs_rent = invest['net_worth_change'] - rent['net_worth_change']
-    
-    print(f"Buy vs. Rent Only Advantage: {format_currency(buy_vs_rent, 'green' if buy_vs_rent > 0 else 'red')}")
-    print(f"Buy vs. Rent+Invest Advantage: {format_currency(buy_vs_invest, 'green' if buy_vs_invest > 0 else 'red')}")
-    print(f"Rent+Invest vs. Rent Only Advantage: {format_currency(invest_vs_rent, 'green' if invest_vs_rent > 0 else 'red')}")
-    
-    best_option = max([
-        ("Buy and Sell", buy['total_benefit']),
-        ("Rent Only", rent['net_worth_change']),
-        ("Rent and Invest", invest['net_worth_change'])
-    ], key=lambda x: x[1])
-    
-    print(f"\n{format_color('Best financial option:', 'bold')} {format_color(best_option[0], 'green')} (Net benefit: {format_currency(best_option[1], 'green' if best_option[1] > 0 else 'red')})")
+    inputs = results.inputs
+    buy = results.buy_and_sell
+    rent = results.rent_only
+    invest = results.rent_and_invest
+    months = inputs.holding_period_years * 12
+    stock_return_pct = inputs.stock_investment_return * 100
+    out = []
+    
+    out.append(f"\n{format_color('===== HOUSING INVESTMENT ANALYSIS =====', 'bold')}\n")
+    
+    out.append(f"{format_color('INPUTS:', 'cyan')}")
+    out.append(f"Purchase Price: {format_currency(inputs.purchase_price, 'yellow')}")
+    out.append(f"Down Payment: {format_currency(inputs.down_payment, 'yellow')} ({inputs.down_payment/inputs.purchase_price*100:.1f}%)")
+    out.append(f"Loan Amount: {format_currency(inputs.loan_amount, 'yellow')} (Purchase Price - Down Payment)")
+    
+    out.append(f"\n{format_color('MORTGAGE PAYMENT CALCULATION:', 'cyan')}")
+    out.append(f"  Loan Amount: {format_currency(inputs.loan_amount, 'yellow')}")
+    out.append(f"  Annual Interest Rate: {format_color(f'{inputs.loan_interest_rate*100:.2f}%', 'purple')}")
+    out.append(f"  Monthly Interest Rate: {format_color(f'{inputs.loan_interest_rate/12*100:.4f}%', 'purple')}")
+    out.append(f"  Loan Term: {format_color(f'{inputs.loan_term_years} years ({inputs.loan_term_years*12} months)', 'white')}")
+    out.append(f"Monthly Mortgage Payment: {format_currency(inputs.monthly_payment, 'green')}")
+    
+    out.append(f"\n{format_color('SCENARIO 1: BUY AND SELL AFTER HOLDING PERIOD', 'cyan')}")
+    out.append("Monthly Mortgage Payment Breakdown:")
+    out.append(f"  Monthly Payment: {format_currency(inputs.monthly_payment, 'green')}")
+    out.append(f"  Number of Months: {format_color(str(months), 'white')} months")
+    out.append(f"Total Mortgage Payments: {format_currency(buy.mortgage_payments, 'red')}")
+    
+    out.append("\nProperty Tax Breakdown:")
+    out.append(f"  Annual Property Tax: {format_currency(buy.property_tax/inputs.holding_period_years, 'yellow')}")
+    out.append(f"Total Property Tax: {format_currency(buy.property_tax, 'red')}")
+    
+    out.append("\nHOA Breakdown:")
+    out.append(f"  Monthly HOA: {format_currency(buy.hoa_fees/months, 'yellow')}")
+    out.append(f"Total HOA Fees: {format_currency(buy.hoa_fees, 'red')}")
+    
+    out.append(f"\n{format_color('Remaining Loan Balance:', 'cyan')} {format_currency(buy.remaining_balance, 'red')}")
+    
+    out.append(f"\n{format_color('Net from Sale Calculation:', 'cyan')}")
+    out.append(f"  Sale Price: {format_currency(inputs.sale_price, 'green')}")
+    out.append(f"  - Selling Costs: {format_currency(buy.selling_costs, 'red')}")
+    out.append(f"  - Remaining Balance: {format_currency(buy.remaining_balance, 'red')}")
+    out.append(f"  = Net from Sale: {format_currency(buy.net_from_sale, 'green')}")
+    
+    out.append(f"\n{format_color('Equity Gain Calculation:', 'cyan')}")
+    out.append(f"  Net from Sale: {format_currency(buy.net_from_sale, 'green')}")
+    out.append("  Money invested:")
+    out.append(f"    - Down Payment: {format_currency(inputs.down_payment, 'red')}")
+    out.append(f"    - Total Mortgage Payments: {format_currency(buy.mortgage_payments, 'red')}")
+    out.append(f"    - Total Property Tax: {format_currency(buy.property_tax, 'red')}")
+    out.append(f"    - Total HOA: {format_currency(buy.hoa_fees, 'red')}")
+    total_invested = inputs.down_payment + buy.mortgage_payments + buy.property_tax + buy.hoa_fees
+    out.append(f"  Total Money Invested: {format_currency(total_invested, 'red')}")
+    out.append(f"  Equity Gain: {format_currency(buy.equity_gain, 'green' if buy.equity_gain > 0 else 'red')}")
+    
+    out.append(f"\n{format_color('Total Benefit Calculation:', 'cyan')}")
+    out.append(f"  Equity Gain: {format_currency(buy.equity_gain, 'green' if buy.equity_gain > 0 else 'red')}")
+    out.append(f"  + Rent Savings: {format_currency(buy.rent_savings, 'green')}")
+    out.append(f"  = Total Benefit: {format_currency(buy.total_benefit, 'green' if buy.total_benefit > 0 else 'red')}")
+    
+    out.append(f"\n{format_color('SCENARIO 2: RENT ONLY', 'cyan')}")
+    out.append("Total Rent Paid Calculation:")
+    out.append(f"  Monthly Rent: {format_currency(inputs.monthly_rent, 'yellow')}")
+    out.append(f"  × Number of Months: {format_color(str(months), 'white')} months")
+    out.append(f"  = Total Rent Paid: {format_currency(rent.total_rent, 'red')} ({format_currency(inputs.monthly_rent, 'yellow')} × {months} months)")
+    out.append(f"  Net Worth Change: {format_currency(rent.net_worth_change, 'red')} (negative of total rent paid)")
+    
+    out.append(f"\n{format_color('SCENARIO 3: RENT AND INVEST DOWN PAYMENT', 'cyan')}")
+    out.append("Rent Cost:")
+    out.append(f"  Monthly Rent: {format_currency(inputs.monthly_rent, 'yellow')}")
+    out.append(f"  × Number of Months: {format_color(str(months), 'white')} months")
+    out.append(f"  = Total Rent Paid: {format_currency(invest.total_rent, 'red')} ({format_currency(inputs.monthly_rent, 'yellow')} × {months} months)")
+    
+    out.append("\nInvestment Calculation:")
+    out.append(f"  Initial Investment (Down Payment): {format_currency(inputs.down_payment, 'yellow')}")
+    out.append(f"  Annual Return Rate: {format_color(f'{stock_return_pct:.1f}%', 'purple')}")
+    out.append(f"  Investment Period: {format_color(str(inputs.holding_period_years), 'white')} years")
+    out.append(f"  Formula: Initial × (1 + Return Rate)^Years")
+    out.append(f"  = {format_currency(inputs.down_payment, 'yellow')} × (1 + {stock_return_pct:.1f}%)^{inputs.holding_period_years}")
+    out.append(f"Investment Future Value: {format_currency(invest.investment_value, 'green')}")
+    out.append(f"Investment Gain: {format_currency(invest.investment_gain, 'green')} (Future Value - Initial Investment)")
+    out.append(f"Net Worth Change: {format_currency(invest.net_worth_change, 'green' if invest.net_worth_change > 0 else 'red')} (Investment Gain - Total Rent)")
+    
+    out.append(f"\n{format_color('COMPARISON:', 'bold')}")
+    buy_vs_rent = buy.total_benefit - rent.net_worth_change
+    buy_vs_invest = buy.total_benefit - invest.net_worth_change
+    invest_vs_rent = invest.net_worth_change - rent.net_worth_change
+    
+    out.append(f"Buy vs. Rent Only Advantage: {format_currency(buy_vs_rent, 'green' if buy_vs_rent > 0 else 'red')}")
+    out.append(f"Buy vs. Rent+Invest Advantage: {format_currency(buy_vs_invest, 'green' if buy_vs_invest > 0 else 'red')}")
+    out.append(f"Rent+Invest vs. Rent Only Advantage: {format_currency(invest_vs_rent, 'green' if invest_vs_rent > 0 else 'red')}")
+    
+    # Straight-line argmax; ties go to the earlier option, as max() did
+    if buy.total_benefit >= rent.net_worth_change and buy.total_benefit >= invest.net_worth_change:
+        best_option = ("Buy and Sell", buy.total_benefit)
+    elif rent.net_worth_change >= invest.net_worth_change:
+        best_option = ("Rent Only", rent.net_worth_change)
+    else:
+        best_option = ("Rent and Invest", invest.net_worth_change)
+    
+    out.append(f"\n{format_color('Best financial option:', 'bold')} {format_color(best_option[0], 'green')} (Net benefit: {format_currency(best_option[1], 'green' if best_option[1] > 0 else 'red')})")
+
+    sys.stdout.write("\n".join(out) + "\n")
 
 def plot_comparison(results):
     """Plot comparison of different scenarios"""
+    import matplotlib.pyplot as plt
+
     labels = ['Buy & Sell', 'Rent Only', 'Rent & Invest']
     values = [
-        results['buy_and_sell']['total_benefit'],
-        results['rent_only']['net_worth_change'],
-        results['rent_and_invest']['net_worth_change']
+        results.buy_and_sell.total_benefit,
+        results.rent_only.net_worth_change,
+        results.rent_and_invest.net_worth_change
     ]
     
     colors = ['green', 'red', 'blue']
     
     plt.figure(figsize=(10, 6))
-    bars = plt.bar(labels, values, color=colors)
+    plt.bar(labels, values, color=colors)
     
     plt.title('Housing Investment Strategy Comparison')
     plt.ylabel('Net Worth Change ($)')
     plt.grid(axis='y', linestyle='--', alpha=0.7)
     
-    # Add values on top of bars
-    for bar in bars:
-        height = bar.get_height()
-        plt.text(bar.get_x() + bar.get_width()/2., height,
+    # Add values on top of bars; categorical bars are centered at x = 0, 1, 2, ...
+    for x, height in enumerate(values):
+        plt.text(x, height,
                  f'${int(height):,}',
                  ha='center', va='bottom' if height > 0 else 'top', 
                  color='black' if height > 0 else 'white')
@@ -281,37 +435,63 @@ def plot_comparison(results):
     plt.tight_layout()
     plt.show()
 
-def enter_data():
-     # Custom scenario - you can modify these values
+# Fields of a custom scenario: (name, prompt, default). Percentages are entered as
+# whole numbers (7 for 7%) and converted to decimals before the analysis.
+INPUT_FIELDS = (
+    ("purchase_price", "Purchase price ($): ", 1085000),
+    ("down_payment_percent", "Down payment percentage (%): ", 30),
+    ("loan_interest_rate", "Loan interest rate (%): ", 2.5),
+    ("loan_term_years", "Loan term (years): ", 30),
+    ("holding_period_years", "Holding period (years): ", 5),
+    ("property_tax_annual", "Annual property tax ($): ", 13440),
+    ("hoa_monthly", "Monthly HOA/maintenance ($): ", 300),
+    ("sale_price", "Expected sale price ($): ", 1400000),
+    ("monthly_rent", "Monthly rent alternative ($): ", 3500),
+    ("stock_investment_return", "Annual stock investment return (%): ", 10),
+    ("selling_cost_percent", "Selling costs (%): ", 7)
+)
+DEFAULTS = {name: default for name, _, default in INPUT_FIELDS}
+_PERCENT_FIELDS = {"down_payment_percent", "loan_interest_rate", "stock_investment_return", "selling_cost_percent"}
+
+def parse_args(argv=None):
+    """Parse custom scenario values from the command line, e.g. --purchase-price 900000"""
+    parser = argparse.ArgumentParser(description="Analyze a custom housing investment scenario")
+    for name, prompt, default in INPUT_FIELDS:
+        label = prompt.rstrip(": ").replace("%", "%%")
+        parser.add_argument(f"--{name.replace('_', '-')}", type=float, default=default,
+                            help=f"{label}, default %(default)s")
+    return parser.parse_args(argv)
+
+def enter_data(**values):
+    """
+    Analyze a custom scenario
+
+    Keyword arguments (named as in INPUT_FIELDS, percentages as whole numbers)
+    override the defaults. Missing values are prompted for when stdin is a
+    terminal and fall back to DEFAULTS otherwise, so scripts can call this
+    without blocking on input().
+    """
+    unknown = values.keys() - DEFAULTS.keys()
+    if unknown:
+        raise TypeError(f"enter_data() got unexpected keyword arguments: {', '.join(sorted(unknown))}")
+
     print("\n\n" + "="*60 + "\n")
-    print("Enter your own values for analysis:")
+    interactive = sys.stdin.isatty()
+    if interactive:
+        print("Enter your own values for analysis:")
     
     try:
-        purchase_price = float(input("Purchase price ($): ") or "1085000")
-        down_payment_percent = float(input("Down payment percentage (%): ") or "30") / 100
-        loan_interest_rate = float(input("Loan interest rate (%): ") or "2.5") / 100
-        loan_term_years = float(input("Loan term (years): ") or "30")
-        holding_period_years = float(input("Holding period (years): ") or "5")
-        property_tax_annual = float(input("Annual property tax ($): ") or "13440")
-        hoa_monthly = float(input("Monthly HOA/maintenance ($): ") or "300")
-        sale_price = float(input("Expected sale price ($): ") or "1400000")
-        monthly_rent = float(input("Monthly rent alternative ($): ") or "3500")
-        stock_investment_return = float(input("Annual stock investment return (%): ") or "10") / 100
-        selling_cost_percent = float(input("Selling costs (%): ") or "7") / 100
+        inputs = {}
+        for name, prompt, default in INPUT_FIELDS:
+            if name in values:
+                value = float(values[name])
+            elif interactive:
+                value = float(input(prompt) or default)
+            else:
+                value = float(default)
+            inputs[name] = value / 100 if name in _PERCENT_FIELDS else value
         
-        custom_results = analyze_housing_investment(
-            purchase_price=purchase_price,
-            down_payment_percent=down_payment_percent,
-            loan_interest_rate=loan_interest_rate,
-            loan_term_years=loan_term_years,
-            holding_period_years=holding_period_years,
-            property_tax_annual=property_tax_annual,
-            hoa_monthly=hoa_monthly,
-            sale_price=sale_price,
-            monthly_rent=monthly_rent,
-            stock_investment_return=stock_investment_return,
-            selling_cost_percent=selling_cost_percent
-        )
+        custom_results = analyze_housing_investment(**inputs)
         
         print("\nCUSTOM SCENARIO ANALYSIS:")
         print_results(custom_results)
@@ -342,18 +522,20 @@ def analyze_income_investment_scenario(monthly_income, monthly_expenses, holding
     if monthly_rate == 0:
         investment_future_value = total_savings
     else:
-        # Formula for regular contributions with compound interest
-        investment_future_value = monthly_savings * ((1 + monthly_rate)**total_months - 1) / monthly_rate * (1 + monthly_rate)
+        # Formula for regular contributions with compound interest; (1 + r)^n - 1 is
+        # evaluated as expm1(n * log1p(r)) so small rates don't lose precision
+        growth_minus_one = math.expm1(total_months * math.log1p(monthly_rate))
+        investment_future_value = monthly_savings * growth_minus_one / monthly_rate * (1 + monthly_rate)
     
     investment_gain = investment_future_value - total_savings
     
     # If we have purchase scenario results, include some comparative data
     comparative_data = {}
     if purchase_scenario_results:
-        buy = purchase_scenario_results["buy_and_sell"]
+        buy = purchase_scenario_results.buy_and_sell
         comparative_data = {
-            "vs_buying_advantage": investment_future_value - buy["total_benefit"],
-            "housing_benefit": buy["total_benefit"]
+            "vs_buying_advantage": investment_future_value - buy.total_benefit,
+            "housing_benefit": buy.total_benefit
         }
     
     results = {
@@ -382,70 +564,76 @@ def print_income_investment_results(results, purchase_scenario_results=None):
     inputs = results["inputs"]
     savings = results["savings"]
     comparative = results.get("comparative", {})
+    months = inputs['holding_period_years'] * 12
+    monthly_return_pct = inputs['stock_investment_return'] / 12 * 100
+    out = []
     
-    print(f"\n{format_color('===== INCOME INVESTMENT ANALYSIS =====', 'bold')}\n")
+    out.append(f"\n{format_color('===== INCOME INVESTMENT ANALYSIS =====', 'bold')}\n")
     
-    print(f"{format_color('MONTHLY CASH FLOW:', 'cyan')}")
-    print(f"Monthly Income: {format_currency(inputs['monthly_income'], 'green')}")
+    out.append(f"{format_color('MONTHLY CASH FLOW:', 'cyan')}")
+    out.append(f"Monthly Income: {format_currency(inputs['monthly_income'], 'green')}")
     
     # Print detailed expense breakdown
-    print(f"\n{format_color('MONTHLY EXPENSES BREAKDOWN:', 'cyan')}")
+    out.append(f"\n{format_color('MONTHLY EXPENSES BREAKDOWN:', 'cyan')}")
     if inputs.get('expense_breakdown'):
         for category, amount in inputs['expense_breakdown'].items():
-            print(f"  {category}: {format_currency(amount, 'red')}")
-    print(f"Total Monthly Expenses: {format_currency(inputs['monthly_expenses'], 'red')}")
-    print(f"Monthly Savings Available for Investment: {format_currency(inputs['monthly_savings'], 'green')}")
-    
-    print(f"\n{format_color('INVESTMENT CALCULATION:', 'cyan')}")
-    print(f"  Monthly Savings Invested: {format_currency(inputs['monthly_savings'], 'green')}")
-    print(f"  Number of Months: {format_color(str(inputs['holding_period_years']*12), 'white')}")
-    print(f"  Monthly Return Rate: {format_color(f'{inputs['stock_investment_return']/12*100:.4f}%', 'purple')}")
-    print(f"  Formula: PMT × ((1 + r)^n - 1) / r × (1 + r)")
-    print(f"    Where:")
-    print(f"    PMT = Monthly Savings ({format_currency(inputs['monthly_savings'], 'green')})")
-    print(f"    r = Monthly Return Rate ({inputs['stock_investment_return']/12*100:.4f}%)")
-    print(f"    n = Number of Months ({inputs['holding_period_years']*12})")
-    print(f"Total Amount Invested: {format_currency(savings['total_invested'], 'yellow')}")
-    print(f"Investment Future Value: {format_currency(savings['investment_value'], 'green')}")
-    print(f"Investment Gain: {format_currency(savings['investment_gain'], 'green')} (Future Value - Total Invested)")
-    print(f"Net Worth Change: {format_currency(savings['net_worth_change'], 'green')}")
+            out.append(f"  {category}: {format_currency(amount, 'red')}")
+    out.append(f"Total Monthly Expenses: {format_currency(inputs['monthly_expenses'], 'red')}")
+    out.append(f"Monthly Savings Available for Investment: {format_currency(inputs['monthly_savings'], 'green')}")
+    
+    out.append(f"\n{format_color('INVESTMENT CALCULATION:', 'cyan')}")
+    out.append(f"  Monthly Savings Invested: {format_currency(inputs['monthly_savings'], 'green')}")
+    out.append(f"  Number of Months: {format_color(str(months), 'white')}")
+    out.append(f"  Monthly Return Rate: {format_color(f'{monthly_return_pct:.4f}%', 'purple')}")
+    out.append(f"  Formula: PMT × ((1 + r)^n - 1) / r × (1 + r)")
+    out.append(f"    Where:")
+    out.append(f"    PMT = Monthly Savings ({format_currency(inputs['monthly_savings'], 'green')})")
+    out.append(f"    r = Monthly Return Rate ({monthly_return_pct:.4f}%)")
+    out.append(f"    n = Number of Months ({months})")
+    out.append(f"Total Amount Invested: {format_currency(savings['total_invested'], 'yellow')}")
+    out.append(f"Investment Future Value: {format_currency(savings['investment_value'], 'green')}")
+    out.append(f"Investment Gain: {format_currency(savings['investment_gain'], 'green')} (Future Value - Total Invested)")
+    out.append(f"Net Worth Change: {format_currency(savings['net_worth_change'], 'green')}")
     
     if purchase_scenario_results:
-        buy = purchase_scenario_results["buy_and_sell"]
-        print(f"\n{format_color('COMPARISON TO HOUSING INVESTMENT:', 'cyan')}")
-        print(f"Income Investment Outcome: {format_currency(savings['net_worth_change'], 'green')}")
-        print(f"Housing Investment Outcome: {format_currency(buy['total_benefit'], 'green' if buy['total_benefit'] > 0 else 'red')}")
-        advantage = savings['net_worth_change'] - buy['total_benefit']
-        print(f"Advantage of Income Investment: {format_currency(advantage, 'green' if advantage > 0 else 'red')}")
+        buy = purchase_scenario_results.buy_and_sell
+        out.append(f"\n{format_color('COMPARISON TO HOUSING INVESTMENT:', 'cyan')}")
+        out.append(f"Income Investment Outcome: {format_currency(savings['net_worth_change'], 'green')}")
+        out.append(f"Housing Investment Outcome: {format_currency(buy.total_benefit, 'green' if buy.total_benefit > 0 else 'red')}")
+        advantage = savings['net_worth_change'] - buy.total_benefit
+        out.append(f"Advantage of Income Investment: {format_currency(advantage, 'green' if advantage > 0 else 'red')}")
         
         if advantage > 0:
-            print(f"\n{format_color('CONCLUSION:', 'bold')} {format_color('Investing your income appears more profitable than buying a house', 'green')}")
+            out.append(f"\n{format_color('CONCLUSION:', 'bold')} {format_color('Investing your income appears more profitable than buying a house', 'green')}")
         else:
-            print(f"\n{format_color('CONCLUSION:', 'bold')} {format_color('Buying a house appears more profitable than just investing your income', 'green')}")
+            out.append(f"\n{format_color('CONCLUSION:', 'bold')} {format_color('Buying a house appears more profitable than just investing your income', 'green')}")
+
+    sys.stdout.write("\n".join(out) + "\n")
 
 def plot_extended_comparison(housing_results, income_results):
     """Plot comparison of housing scenarios and income investment"""
+    import matplotlib.pyplot as plt
+
     labels = ['Buy & Sell', 'Rent Only', 'Rent & Invest', 'Income Investment']
     values = [
-        housing_results['buy_and_sell']['total_benefit'],
-        housing_results['rent_only']['net_worth_change'],
-        housing_results['rent_and_invest']['net_worth_change'],
+        housing_results.buy_and_sell.total_benefit,
+        housing_results.rent_only.net_worth_change,
+        housing_results.rent_and_invest.net_worth_change,
         income_results['savings']['net_worth_change']
     ]
     
     colors = ['green', 'red', 'blue', 'purple']
     
     plt.figure(figsize=(12, 7))
-    bars = plt.bar(labels, values, color=colors)
+    plt.bar(labels, values, color=colors)
     
     plt.title('Investment Strategy Comparison')
     plt.ylabel('Net Worth Change ($)')
     plt.grid(axis='y', linestyle='--', alpha=0.7)
     
-    # Add values on top of bars
-    for bar in bars:
-        height = bar.get_height()
-        plt.text(bar.get_x() + bar.get_width()/2., height,
+    # Add values on top of bars; categorical bars are centered at x = 0, 1, 2, ...
+    for x, height in enumerate(values):
+        plt.text(x, height,
                  f'${int(height):,}',
                  ha='center', va='bottom' if height > 0 else 'top', 
                  color='black' if height > 0 else 'white')
@@ -453,6 +641,20 @@ def plot_extended_comparison(housing_results, income_results):
     plt.tight_layout()
     plt.show()
 
+# Living expenses that are the same whether you buy or rent
+_SHARED_EXPENSE_ITEMS = {
+    "Utilities": 300,
+    "Internet & Phone": 150,
+    "Groceries & Food": 800,
+    "Transportation": 500,
+    "Healthcare & Insurance": 400,
+    "Entertainment": 600,
+    "Personal Care": 400,
+    "Emergency Fund": 500,
+    "Miscellaneous": 350
+}
+_SHARED_EXPENSE_SUM = sum(_SHARED_EXPENSE_ITEMS.values())
+
 def analyze_historical_scenario(initial_capital, monthly_income, purchase_price, down_payment_percent,
                              loan_interest_rate, loan_term_years, holding_period_years,
                              property_tax_annual, hoa_monthly, sale_price, monthly_rent,
@@ -479,46 +681,34 @@ def analyze_historical_scenario(initial_capital, monthly_income, purchase_price,
         selling_cost_percent=0.07
     )
     
+    # Both lump-sum stock scenarios compound over the same period at the same rate
+    stock_growth = (1 + stock_investment_return)**holding_period_years
+    
     # Calculate stock returns on remaining capital after down payment
-    remaining_stock_future_value = remaining_capital * (1 + stock_investment_return)**holding_period_years
+    remaining_stock_future_value = remaining_capital * stock_growth
     remaining_stock_gain = remaining_stock_future_value - remaining_capital
     
     # Calculate full stock investment scenario (no house purchase)
-    full_stock_future_value = initial_capital * (1 + stock_investment_return)**holding_period_years
+    full_stock_future_value = initial_capital * stock_growth
     full_stock_gain = full_stock_future_value - initial_capital
     
     # Calculate monthly expenses for both scenarios
+    monthly_payment = housing_results.inputs.monthly_payment
     house_expense_breakdown = {
-        "Mortgage Payment": housing_results['inputs']['monthly_payment'],
+        "Mortgage Payment": monthly_payment,
         "Property Tax": property_tax_annual / 12,
         "HOA/Maintenance": hoa_monthly,
-        "Utilities": 300,
-        "Internet & Phone": 150,
-        "Groceries & Food": 800,
-        "Transportation": 500,
-        "Healthcare & Insurance": 400,
-        "Entertainment": 600,
-        "Personal Care": 400,
-        "Emergency Fund": 500,
-        "Miscellaneous": 350
+        **_SHARED_EXPENSE_ITEMS
     }
     
     rent_expense_breakdown = {
         "Rent": monthly_rent,
-        "Utilities": 300,
-        "Internet & Phone": 150,
-        "Groceries & Food": 800,
-        "Transportation": 500,
-        "Healthcare & Insurance": 400,
-        "Entertainment": 600,
-        "Personal Care": 400,
-        "Emergency Fund": 500,
-        "Miscellaneous": 350
+        **_SHARED_EXPENSE_ITEMS
     }
     
     # Calculate monthly savings and investment for both scenarios
-    house_monthly_expenses = sum(house_expense_breakdown.values())
-    rent_monthly_expenses = sum(rent_expense_breakdown.values())
+    house_monthly_expenses = monthly_payment + property_tax_annual / 12 + hoa_monthly + _SHARED_EXPENSE_SUM
+    rent_monthly_expenses = monthly_rent + _SHARED_EXPENSE_SUM
     
     # Calculate income investment results for both scenarios
     house_income_results = analyze_income_investment_scenario(
@@ -548,7 +738,7 @@ def analyze_historical_scenario(initial_capital, monthly_income, purchase_price,
                 "gain": remaining_stock_gain
             },
             "income_investment": house_income_results,
-            "total_net_worth": (housing_results['buy_and_sell']['total_benefit'] + 
+            "total_net_worth": (housing_results.buy_and_sell.total_benefit + 
                               remaining_stock_future_value +
                               house_income_results['savings']['net_worth_change'])
         },
@@ -566,53 +756,61 @@ def analyze_historical_scenario(initial_capital, monthly_income, purchase_price,
 
 def print_historical_scenario_results(results):
     """Print analysis results for historical scenario"""
-    print(f"\n{format_color('===== HISTORICAL SCENARIO ANALYSIS (5 YEARS AGO) =====', 'bold')}\n")
+    out = []
+    out.append(f"\n{format_color('===== HISTORICAL SCENARIO ANALYSIS (5 YEARS AGO) =====', 'bold')}\n")
     
-    print(f"{format_color('INITIAL CONDITIONS:', 'cyan')}")
-    print(f"Initial Capital: {format_currency(results['initial_capital'], 'green')}")
-    print(f"Monthly Income: {format_currency(results['monthly_income'], 'green')}")
+    out.append(f"{format_color('INITIAL CONDITIONS:', 'cyan')}")
+    out.append(f"Initial Capital: {format_currency(results['initial_capital'], 'green')}")
+    out.append(f"Monthly Income: {format_currency(results['monthly_income'], 'green')}")
     
     house = results['house_scenario']
     stock = results['full_stock_scenario']
     
-    print(f"\n{format_color('SCENARIO 1: BUY HOUSE + INVEST REMAINING + SAVE INCOME', 'cyan')}")
-    print("House Investment:")
-    print(f"  Down Payment: {format_currency(house['housing_results']['inputs']['down_payment'], 'red')}")
-    print(f"  House Total Benefit: {format_currency(house['housing_results']['buy_and_sell']['total_benefit'], 'green')}")
+    out.append(f"\n{format_color('SCENARIO 1: BUY HOUSE + INVEST REMAINING + SAVE INCOME', 'cyan')}")
+    out.append("House Investment:")
+    out.append(f"  Down Payment: {format_currency(house['housing_results'].inputs.down_payment, 'red')}")
+    out.append(f"  House Total Benefit: {format_currency(house['housing_results'].buy_and_sell.total_benefit, 'green')}")
     
-    print("\nRemaining Capital Investment in S&P 500:")
-    print(f"  Amount Invested: {format_currency(house['remaining_capital_investment']['amount'], 'yellow')}")
-    print(f"  Future Value: {format_currency(house['remaining_capital_investment']['future_value'], 'green')}")
-    print(f"  Investment Gain: {format_currency(house['remaining_capital_investment']['gain'], 'green')}")
+    out.append("\nRemaining Capital Investment in S&P 500:")
+    out.append(f"  Amount Invested: {format_currency(house['remaining_capital_investment']['amount'], 'yellow')}")
+    out.append(f"  Future Value: {format_currency(house['remaining_capital_investment']['future_value'], 'green')}")
+    out.append(f"  Investment Gain: {format_currency(house['remaining_capital_investment']['gain'], 'green')}")
     
-    print("\nMonthly Income Investment:")
-    print(f"  Monthly Expenses: {format_currency(house['income_investment']['inputs']['monthly_expenses'], 'red')}")
-    print(f"  Monthly Investment: {format_currency(house['income_investment']['inputs']['monthly_savings'], 'green')}")
-    print(f"  Future Value: {format_currency(house['income_investment']['savings']['investment_value'], 'green')}")
+    out.append("\nMonthly Income Investment:")
+    out.append(f"  Monthly Expenses: {format_currency(house['income_investment']['inputs']['monthly_expenses'], 'red')}")
+    out.append(f"  Monthly Investment: {format_currency(house['income_investment']['inputs']['monthly_savings'], 'green')}")
+    out.append(f"  Future Value: {format_currency(house['income_investment']['savings']['investment_value'], 'green')}")
     
-    print(f"\n{format_color('Total Net Worth (House Scenario):', 'bold')} {format_currency(house['total_net_worth'], 'green')}")
+    out.append(f"\n{format_color('Total Net Worth (House Scenario):', 'bold')} {format_currency(house['total_net_worth'], 'green')}")
     
-    print(f"\n{format_color('SCENARIO 2: INVEST ALL IN S&P 500 + RENT + SAVE INCOME', 'cyan')}")
-    print("Initial Capital Investment in S&P 500:")
-    print(f"  Amount Invested: {format_currency(stock['initial_investment']['amount'], 'yellow')}")
-    print(f"  Future Value: {format_currency(stock['initial_investment']['future_value'], 'green')}")
-    print(f"  Investment Gain: {format_currency(stock['initial_investment']['gain'], 'green')}")
+    out.append(f"\n{format_color('SCENARIO 2: INVEST ALL IN S&P 500 + RENT + SAVE INCOME', 'cyan')}")
+    out.append("Initial Capital Investment in S&P 500:")
+    out.append(f"  Amount Invested: {format_currency(stock['initial_investment']['amount'], 'yellow')}")
+    out.append(f"  Future Value: {format_currency(stock['initial_investment']['future_value'], 'green')}")
+    out.append(f"  Investment Gain: {format_currency(stock['initial_investment']['gain'], 'green')}")
     
-    print("\nMonthly Income Investment:")
-    print(f"  Monthly Expenses: {format_currency(stock['income_investment']['inputs']['monthly_expenses'], 'red')}")
-    print(f"  Monthly Investment: {format_currency(stock['income_investment']['inputs']['monthly_savings'], 'green')}")
-    print(f"  Future Value: {format_currency(stock['income_investment']['savings']['investment_value'], 'green')}")
+    out.append("\nMonthly Income Investment:")
+    out.append(f"  Monthly Expenses: {format_currency(stock['income_investment']['inputs']['monthly_expenses'], 'red')}")
+    out.append(f"  Monthly Investment: {format_currency(stock['income_investment']['inputs']['monthly_savings'], 'green')}")
+    out.append(f"  Future Value: {format_currency(stock['income_investment']['savings']['investment_value'], 'green')}")
     
-    print(f"\n{format_color('Total Net Worth (Full Stock Scenario):', 'bold')} {format_currency(stock['total_net_worth'], 'green')}")
+    out.append(f"\n{format_color('Total Net Worth (Full Stock Scenario):', 'bold')} {format_currency(stock['total_net_worth'], 'green')}")
     
     advantage = house['total_net_worth'] - stock['total_net_worth']
     better_option = "BUYING A HOUSE" if advantage > 0 else "INVESTING IN S&P 500"
-    print(f"\n{format_color('CONCLUSION:', 'bold')}")
-    print(f"Advantage of {better_option}: {format_currency(abs(advantage), 'green')}")
-    print(f"The better financial decision 5 years ago would have been: {format_color(better_option, 'green')}")
+    out.append(f"\n{format_color('CONCLUSION:', 'bold')}")
+    out.append(f"Advantage of {better_option}: {format_currency(abs(advantage), 'green')}")
+    out.append(f"The better financial decision 5 years ago would have been: {format_color(better_option, 'green')}")
+
+    sys.stdout.write("\n".join(out) + "\n")
 
 # Example usage with the scenario from the conversation
 if __name__ == "__main__":
+    # With command-line options, analyze just that scenario (see parse_args)
+    if sys.argv[1:]:
+        enter_data(**vars(parse_args()))
+        sys.exit()
+    
     purchase_price = 1085000
     down_payment_percent = 0.20
     loan_interest_rate = 0.065
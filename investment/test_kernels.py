@@ -0,0 +1,113 @@
+import dataclasses
+import math
+import random
+import subprocess
+import sys
+from pathlib import Path
+
+import pytest
+
+pytest.importorskip("numba")
+np = pytest.importorskip("numpy")
+
+import main
+from kernels import mortgage_math
+from main import _mortgage_math
+
+# Keyword arguments of analyze_housing_investment for the example scenario in main.py
+EXAMPLE = dict(
+    purchase_price=1085000, down_payment_percent=0.3, loan_interest_rate=0.025,
+    loan_term_years=30, holding_period_years=5, property_tax_annual=13440,
+    hoa_monthly=300, sale_price=1400000, monthly_rent=3500,
+    stock_investment_return=0.1, selling_cost_percent=0.07,
+)
+
+
+def _scenarios(count=1000, seed=0):
+    """Random loans plus zero-rate and fully-paid-off edge cases"""
+    rng = random.Random(seed)
+    for _ in range(count):
+        principal = rng.uniform(1_000, 2_000_000)
+        num_payments = rng.choice((60, 120, 180, 360))
+        months_paid = rng.randint(0, num_payments + 24)
+        yield principal, rng.uniform(0.0001, 0.01), num_payments, months_paid
+        yield principal, 0.0, num_payments, months_paid
+
+
+@pytest.mark.parametrize("impl", [mortgage_math, mortgage_math.py_func], ids=["compiled", "python"])
+def test_kernel_mortgage_math_matches_scalar(impl):
+    # kernels.mortgage_math is a hand-kept copy of main._mortgage_math; keep them in step
+    for principal, monthly_rate, num_payments, months_paid in _scenarios():
+        expected = _mortgage_math(principal, monthly_rate, num_payments, months_paid)
+        actual = impl(principal, monthly_rate, num_payments, months_paid)
+        for a, e in zip(actual, expected):
+            assert math.isclose(a, e, rel_tol=1e-9, abs_tol=1e-6)
+
+
+def _housing_scenarios(count=500, seed=0):
+    """Random analyze_housing_investment arguments, including zero rates and loans paid off while held"""
+    rng = random.Random(seed)
+    for i in range(count):
+        loan_term_years = rng.choice((10, 15, 30))
+        yield dict(
+            purchase_price=rng.uniform(200_000, 3_000_000),
+            down_payment_percent=rng.uniform(0.05, 0.6),
+            loan_interest_rate=0.0 if i % 5 == 0 else rng.uniform(0.01, 0.09),
+            loan_term_years=loan_term_years,
+            holding_period_years=loan_term_years + rng.randint(0, 5) if i % 7 == 0 else rng.randint(1, loan_term_years),
+            property_tax_annual=rng.uniform(0, 40_000),
+            hoa_monthly=rng.uniform(0, 1_000),
+            sale_price=rng.uniform(150_000, 4_000_000),
+            monthly_rent=rng.uniform(1_000, 10_000),
+            stock_investment_return=rng.uniform(-0.05, 0.15),
+            selling_cost_percent=rng.uniform(0.0, 0.1),
+        )
+
+
+def _assert_matches_scalar(batch, index, expected):
+    """Compare every field of a batch result at index with a scalar HousingResults"""
+    for group in dataclasses.fields(expected):
+        expected_group = getattr(expected, group.name)
+        batch_group = getattr(batch, group.name)
+        for field in dataclasses.fields(expected_group):
+            actual = np.asarray(getattr(batch_group, field.name))[index]
+            assert math.isclose(actual, getattr(expected_group, field.name), rel_tol=1e-9, abs_tol=1e-6), \
+                f"{group.name}.{field.name} at {index}"
+
+
+def test_batch_matches_scalar():
+    scenarios = list(_housing_scenarios())
+    batch = main.analyze_housing_investment_batch(
+        **{name: np.array([s[name] for s in scenarios]) for name in scenarios[0]})
+    for i, scenario in enumerate(scenarios):
+        _assert_matches_scalar(batch, i, main.analyze_housing_investment(**scenario))
+
+
+def test_batch_broadcasts_grid():
+    rates = np.array([0.0, 0.025, 0.07])
+    prices = np.array([900_000, 1_400_000, 2_000_000, 2_500_000])
+    args = dict(EXAMPLE, loan_interest_rate=rates[:, None], sale_price=prices[None, :])
+    batch = main.analyze_housing_investment_batch(**args)
+    assert batch.buy_and_sell.total_benefit.shape == (3, 4)
+    for i, rate in enumerate(rates):
+        for j, price in enumerate(prices):
+            expected = main.analyze_housing_investment(
+                **dict(EXAMPLE, loan_interest_rate=float(rate), sale_price=float(price)))
+            _assert_matches_scalar(batch, (i, j), expected)
+
+
+def test_batch_under_both_import_names():
+    # main.py runs as a script (plain "kernels" import) and is imported as investment.main.
+    # Each run gets a fresh interpreter so anything Numba caches on disk under one name
+    # has to load under the other
+    here = Path(__file__).resolve().parent
+    call = f"m.analyze_housing_investment_batch(**{EXAMPLE!r})"
+    runs = [
+        ("import investment.main as m", here.parent),
+        ("import main as m", here),
+        ("import investment.main as m", here.parent),
+    ]
+    for import_line, cwd in runs:
+        proc = subprocess.run([sys.executable, "-c", f"{import_line}; {call}"],
+                              cwd=cwd, capture_output=True, text=True)
+        assert proc.returncode == 0, f"{import_line}:\n{proc.stderr}"
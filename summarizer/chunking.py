@@ -0,0 +1,42 @@
+from bisect import bisect_right
+
+
+def split_by_tokens(content: str, chunk_tokens: int) -> list[str]:
+    """
+    Split content into chunks spanning at most chunk_tokens cl100k_base tokens
+
+    Byte-level BPE can spread one CJK character over several tokens, so each cut is
+    moved back to a UTF-8 character boundary rather than decoding a partial character.
+    A single character longer than the budget becomes a chunk of its own.
+    """
+    if chunk_tokens < 1:
+        raise ValueError(f"chunk_tokens must be at least 1, got {chunk_tokens}")
+
+    import tiktoken
+    encoding = tiktoken.get_encoding("cl100k_base")
+    data = content.encode("utf-8")
+    # Byte offset at which each token starts, plus the end of the text
+    offsets = [0]
+    for token in encoding.encode(content, disallowed_special=()):
+        offsets.append(offsets[-1] + len(encoding.decode_single_token_bytes(token)))
+    num_tokens = len(offsets) - 1
+
+    def inside_character(i):
+        # Bytes 0b10xxxxxx continue a multi-byte character
+        return i < len(data) and data[i] & 0xC0 == 0x80
+
+    chunks = []
+    start = 0
+    while start < len(data):
+        # The chunk may begin inside a token; it ends after chunk_tokens tokens counting that one
+        first_token = bisect_right(offsets, start) - 1
+        end = offsets[min(first_token + chunk_tokens, num_tokens)]
+        while end > start and inside_character(end):
+            end -= 1
+        if end == start:
+            end = start + 1
+            while inside_character(end):
+                end += 1
+        chunks.append(data[start:end].decode("utf-8"))
+        start = end
+    return chunks
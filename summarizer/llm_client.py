@@ -1,25 +1,56 @@
 import requests
 import json
+import logging
 import os
+import functools
+import hashlib
+import tempfile
+from pathlib import Path
 from dotenv import load_dotenv
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 load_dotenv()
+log = logging.getLogger(__name__)
 OPENROUTER_API_KEY = os.getenv("OPENROUTER_API_KEY")
 llm_model = os.getenv("OPENROUTER_MODEL_LLAMA")
-def call_llm(sys_prompt: str, user_input: str, model: str = llm_model) -> str:
-    print(f"Calling LLM with model: {model}")
-    data = {
+CACHE_DIR = Path.home() / ".cache" / "summarizer"
+# (connect, read) seconds; without a timeout a stalled connection would block a worker forever
+REQUEST_TIMEOUT = (10, 120)
+# Connections kept open to OpenRouter, threads beyond this would reconnect on every request
+MAX_CONNECTIONS = 32
+# Shared across calls and threads so the TCP/TLS connection to OpenRouter is reused
+session = requests.Session()
+session.headers.update({
+    "Authorization": f"Bearer {OPENROUTER_API_KEY}",
+    "HTTP-Referer": "https://runmyflow.com",
+    "X-Title": "runmyflow",
+})
+# Retry rate limits, server errors and dropped connections with exponential backoff (no wait, then 2s, 4s, 8s, 16s)
+session.mount("https://", HTTPAdapter(pool_maxsize=MAX_CONNECTIONS, max_retries=Retry(
+    total=5,
+    backoff_factor=1,
+    status_forcelist=(429, 500, 502, 503, 504),
+    allowed_methods=frozenset({"POST"}),
+)))
+
+def build_chat_request(model: str, sys_prompt: str, user_input: str) -> dict:
+    """OpenRouter chat payload with a single system and user message"""
+    return {
         "model": model,
-        "messages":[
-            {"role": "system", "content": str(sys_prompt)},
-            {"role": "user", "content": str(user_input)}
+        "messages": [
+            {"role": "system", "content": sys_prompt},
+            {"role": "user", "content": user_input}
         ],
     }
-    return call_openrouter(data)
+
+def call_llm(sys_prompt: str, user_input: str, model: str = llm_model) -> str:
+    log.info("Calling LLM with model: %s", model)
+    return call_openrouter(build_chat_request(model, sys_prompt, user_input))
 
 
 def call_llm_vision(user_input: str, image_url: str, model: str) -> str:
-    print(f"Calling LLM with vision model: {model}")
+    log.info("Calling LLM with vision model: %s", model)
     data = {
         "model": model,
         "messages": [
@@ -28,12 +59,12 @@ def call_llm_vision(user_input: str, image_url: str, model: str) -> str:
                 "content": [
                     {
                         "type": "text",
-                        "text": str(user_input)
+                        "text": user_input
                     },
                     {
                         "type": "image_url",
                         "image_url": {
-                            "url": str(image_url)
+                            "url": image_url
                         }
                     }
                 ]
@@ -42,27 +73,60 @@ def call_llm_vision(user_input: str, image_url: str, model: str) -> str:
     }
     return call_openrouter(data)
 
+def disk_cache(func):
+    """Cache responses under CACHE_DIR, keyed by a hash of the request payload"""
+    @functools.wraps(func)
+    def wrapper(data: dict) -> str:
+        key = hashlib.sha256(json.dumps(data, sort_keys=True).encode()).hexdigest()
+        path = CACHE_DIR / f"{key}.txt"
+        try:
+            cached = path.read_bytes().decode("utf-8")
+        except FileNotFoundError:
+            cached = ""
+        # Entries are never empty, so an empty file is a miss like a missing one
+        if cached:
+            return cached
+        result = func(data)
+        # Failures raise before reaching here; an empty completion is more likely a model
+        # hiccup than an answer, so leave it uncached and ask again next time
+        if result:
+            CACHE_DIR.mkdir(parents=True, exist_ok=True)
+            # Write a temp file and rename it into place, so a killed process or a concurrent
+            # reader never sees a truncated entry
+            fd, tmp_path = tempfile.mkstemp(dir=CACHE_DIR, suffix=".tmp")
+            try:
+                with os.fdopen(fd, "wb") as tmp_file:
+                    tmp_file.write(result.encode("utf-8"))
+                os.replace(tmp_path, path)
+            except BaseException:
+                os.unlink(tmp_path)
+                raise
+        return result
+    return wrapper
+
+@disk_cache
 def call_openrouter(data: dict) -> str:
-    try:
-        response = requests.post(
+    """
+    Send a chat completion request to OpenRouter and return the reply text
+
+    Network-bound: each call waits seconds on the model, so speed comes from running
+    calls concurrently and caching them, not from tuning the local code.
+    """
+    response = session.post(
         url="https://openrouter.ai/api/v1/chat/completions",
-        headers={
-            "Authorization": f"Bearer {OPENROUTER_API_KEY}",
-            "HTTP-Referer": "https://runmyflow.com", 
-            "X-Title": "runmyflow",
-        },
-        data=json.dumps(data)
-        )
-        response_json = response.json()
-        print(f"response_json: {json.dumps(response_json, indent=2)}")
-        if response_json.get("choices"):
-            return response_json["choices"][0]["message"]["content"]
-        else:
-            return ""
-    except Exception as e:
-        print(f"Error: {e}")
-        return ""
+        json=data,
+        timeout=REQUEST_TIMEOUT
+    )
+    response.raise_for_status()
+    response_json = response.json()
+    # Pretty-printing re-serializes the whole response, only do it when debug logging is on
+    if log.isEnabledFor(logging.DEBUG):
+        log.debug("response_json: %s", json.dumps(response_json, indent=2))
+    if not response_json.get("choices"):
+        raise RuntimeError(f"OpenRouter returned no choices: {response_json.get('error', response_json)}")
+    return response_json["choices"][0]["message"]["content"]
 
 if __name__ == "__main__":
+   logging.basicConfig(level=os.getenv("LOGLEVEL", "INFO"))
    response = call_llm(sys_prompt="You are a helpful assistant", user_input="What is the meaning of life?", model=llm_model)
    print(f"response: {response}")
\ No newline at end of file
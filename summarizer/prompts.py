@@ -117,4 +117,10 @@ Remember to use markdown syntax for formatting, including:
 - * for italic text
 
 Ensure that your blog post is well-structured, engaging, and accurately reflects the content of the podcast while providing value to potential readers who haven't listened to the original audio.
-"""
\ No newline at end of file
+"""
+# podcast_prompt_2 split around the transcript once at import, so per-chunk prompts are plain concatenation
+_podcast_prompt_2_head, _podcast_prompt_2_tail = podcast_prompt_2.split("{TRANSCRIPT}")
+
+def make_podcast_prompt_2(highlights: str, transcript: str) -> str:
+    """Same result as podcast_prompt_2.format(HIGHLIGHTS=highlights, TRANSCRIPT=transcript)"""
+    return _podcast_prompt_2_head.replace("{HIGHLIGHTS}", highlights) + transcript + _podcast_prompt_2_tail
@@ -1,36 +1,51 @@
 
+import logging
 import os
+from concurrent.futures import ThreadPoolExecutor
 from dotenv import load_dotenv
-from llm_client import call_openrouter
-from prompts import podcast_prompt, chunk_prompt, system_prompt, podcast_prompt_2, system_prompt_2
+from chunking import split_by_tokens
+from llm_client import MAX_CONNECTIONS, build_chat_request, call_openrouter
+from prompts import podcast_prompt, chunk_prompt, system_prompt, make_podcast_prompt_2, system_prompt_2
 
 load_dotenv()
+log = logging.getLogger(__name__)
 OPENROUTER_API_KEY = os.getenv("OPENROUTER_API_KEY")
 OPENROUTER_MODEL_LLAMA = os.getenv("OPENROUTER_MODEL_LLAMA")
 OPENROUTER_MODEL_CLAUDE_35_SONNET = os.getenv("OPENROUTER_MODEL_CLAUDE_35_SONNET")
 OPENROUTER_MODEL_GEMINI = os.getenv("OPENROUTER_MODEL_GEMINI")
 llm_model = OPENROUTER_MODEL_CLAUDE_35_SONNET
-print(f"llm_model: {llm_model}")
 
 
 
 from utils import srt_to_txt_newline
 
-def summarize_file(sys_prompt: str, file_path: str, output_file: str, chunk_size: int = 10000, model: str = llm_model, chunking: bool = False, language: str = "English") -> None:
+def summarize_file(sys_prompt: str, file_path: str, output_file: str, chunk_tokens: int = 2500, model: str = llm_model, chunking: bool = False, language: str = "English", max_workers: int = 8) -> None:
+    """
+    Summarize a transcript file, optionally in token-sized chunks, and write the result to output_file
+
+    chunk_tokens defaults to about the 10,000 characters of English text chunks used to hold.
+
+    Network-bound: the LLM calls dominate, so chunks are sent concurrently (max_workers threads,
+    capped at llm_client.MAX_CONNECTIONS so every thread keeps a pooled connection).
+    """
     try:
         # Read the input file
         with open(file_path, 'r', encoding='utf-8') as file:
             content = file.read()
+        # Nothing to summarize, don't spend a request on it
+        if not content or content.isspace():
+            log.warning("Empty input %s, skipping", file_path)
+            return
 
         # Split the content into chunks
         if chunking:
-            chunks = [content[i:i+chunk_size] for i in range(0, len(content), chunk_size)]
+            # Sized in tokens, characters map to very different token counts across languages
+            chunks = split_by_tokens(content, chunk_tokens)
+            log.info("Split input into %d chunks of up to %d tokens", len(chunks), chunk_tokens)
         else:
             chunks = [content]
 
         # Summarize each chunk
-        summaries = []
-        previous_summary = ""
         highlights = """
 In this episode, we cover:
 (00:00) Introduction to Wes Kao
@@ -53,20 +68,20 @@ In this episode, we cover:
 (01:19:59) Leveraging AI for better communication
 (01:22:01) Lightning round
 """
-        for i, chunk in enumerate(chunks):
-            print(f"Summarizing chunk {i+1}/{len(chunks)}, length: {len(chunk)}")
+        requests_data = []
+        for chunk in chunks:
+            # chunk_prompt chains the previous chunk's summary, so it would need the chunks summarized one by one
             # prompt = chunk_prompt.format(previous_summary=previous_summary, chunk_transcript=chunk, language=language)
-            prompt = podcast_prompt_2.format( HIGHLIGHTS=highlights, TRANSCRIPT=chunk)
-            data = {
-                "model": model,
-                "messages": [
-                    {"role": "system", "content": system_prompt_2},
-                    {"role": "user", "content": prompt}
-                ]
-            }
-            summary = call_openrouter(data)
-            summaries.append(summary)
-            previous_summary = summary
+            prompt = make_podcast_prompt_2(highlights, chunk)
+            requests_data.append(build_chat_request(model, system_prompt_2, prompt))
+
+        def summarize_chunk(i, data):
+            log.info("Summarizing chunk %d/%d", i + 1, len(requests_data))
+            return call_openrouter(data)
+
+        # Chunks are independent, so send them concurrently; map() keeps the chunk order
+        with ThreadPoolExecutor(max_workers=min(max_workers, MAX_CONNECTIONS)) as executor:
+            summaries = list(executor.map(summarize_chunk, range(len(requests_data)), requests_data))
         # Write summaries to the output file
 
         with open(output_file, 'w', encoding='utf-8') as out_file:
@@ -74,27 +89,24 @@ In this episode, we cover:
                 # out_file.write(f"Summary of chunk {i+1}:\n{summary}\n\n")
                 out_file.write(summary)
 
-        print(f"Summaries have been saved to {output_file}")
+        log.info("Summaries have been saved to %s", output_file)
 
     except Exception as e:
-        print(f"Error in summarize_file: {e}")
+        log.exception("Error in summarize_file: %s", e)
 
 
 def call_llm_with_file(prompt: str, file_path: str, output_file: str) -> None:
     with open(file_path, 'r', encoding='utf-8') as file:
         content = file.read()
-    data = {
-        "model": llm_model,
-        "messages": [
-            {"role": "system", "content": prompt},
-            {"role": "user", "content": content}
-        ]
-    }
-    summary = call_openrouter(data)
+    if not content or content.isspace():
+        log.warning("Empty input %s, skipping", file_path)
+        return
+    summary = call_openrouter(build_chat_request(llm_model, prompt, content))
     with open(output_file, 'w', encoding='utf-8') as out_file:
         out_file.write(summary)
 
 if __name__ == "__main__":
+    logging.basicConfig(level=os.getenv("LOGLEVEL", "INFO"))
     # ... existing code ...
     
     # Example usage of summarize_file
@@ -110,6 +122,7 @@ if __name__ == "__main__":
     summary_output_file = "/Users/danny/Documents/repos/graph2code/tmp/cc/become_a_better_communicator_summary_5.md"
 
     llm_model = OPENROUTER_MODEL_CLAUDE_35_SONNET
+    log.info("llm_model: %s", llm_model)
     # no_chunking = True
     # summarize_file(podcast_prompt.format(language="Chinese"), output_file, summary_output_file, no_chunking=no_chunking, model=llm_model)
 
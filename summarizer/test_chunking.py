@@ -0,0 +1,67 @@
+import sys
+import types
+
+import pytest
+
+from chunking import split_by_tokens
+
+TEXT = "你好世界，这是一个测试。Hello, world! 😀🎉 混合 text 🇨🇳\n" * 20
+
+
+class ByteEncoding:
+    """Stand-in for a tiktoken encoding: every token is `width` raw bytes, so tokens cut through characters"""
+
+    def __init__(self, width):
+        self.width = width
+        self.tokens = []
+
+    def encode(self, text, disallowed_special=()):
+        data = text.encode("utf-8")
+        self.tokens = [data[i:i + self.width] for i in range(0, len(data), self.width)]
+        return list(range(len(self.tokens)))
+
+    def decode_single_token_bytes(self, token):
+        return self.tokens[token]
+
+
+@pytest.fixture(params=[1, 2, 3], ids=lambda width: f"{width}-byte-tokens")
+def byte_encoding(request, monkeypatch):
+    encoding = ByteEncoding(request.param)
+    monkeypatch.setitem(sys.modules, "tiktoken", types.SimpleNamespace(get_encoding=lambda name: encoding))
+    return encoding
+
+
+@pytest.mark.parametrize("chunk_tokens", [1, 2, 3, 7, 100, 100_000])
+def test_chunks_round_trip(byte_encoding, chunk_tokens):
+    chunks = split_by_tokens(TEXT, chunk_tokens)
+    assert "".join(chunks) == TEXT
+    assert all(chunks)
+    assert "�" not in "".join(chunks)
+
+
+def test_chunks_respect_budget(byte_encoding):
+    # A chunk spans at most 4 tokens unless a single character is longer than that
+    for chunk in split_by_tokens(TEXT, 4):
+        assert len(chunk.encode("utf-8")) <= 4 * byte_encoding.width or len(chunk) == 1
+
+
+def test_empty_content(byte_encoding):
+    assert split_by_tokens("", 10) == []
+
+
+@pytest.mark.parametrize("chunk_tokens", [0, -1])
+def test_rejects_non_positive_budget(chunk_tokens):
+    with pytest.raises(ValueError):
+        split_by_tokens(TEXT, chunk_tokens)
+
+
+def test_round_trip_with_cl100k_base():
+    tiktoken = pytest.importorskip("tiktoken")
+    try:
+        tiktoken.get_encoding("cl100k_base")
+    except Exception as e:
+        pytest.skip(f"cl100k_base vocabulary unavailable: {e}")
+    for chunk_tokens in (1, 2, 3, 50):
+        chunks = split_by_tokens(TEXT, chunk_tokens)
+        assert "".join(chunks) == TEXT
+        assert all(chunks)